@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import argparse
+from importlib import import_module
 from typing import Callable
 
-from monarch_tools.commands.hello import cmd_hello
-from monarch_tools.commands.name import cmd_name
-from monarch_tools.commands.help import cmd_help
-from monarch_tools.commands.extract import cmd_extract
-
 CommandFn = Callable[[argparse.Namespace], int]
 
+# Handlers are resolved on demand so a command only imports its own module.
+HANDLERS: dict[str, str] = {
+    "hello": "monarch_tools.commands.hello:cmd_hello",
+    "name": "monarch_tools.commands.name:cmd_name",
+    "help": "monarch_tools.commands.help:cmd_help",
+    "extract": "monarch_tools.commands.extract:cmd_extract",
+}
+
+def resolve_handler(command: str) -> CommandFn:
+    module_name, _, attr = HANDLERS[command].partition(":")
+    return getattr(import_module(module_name), attr)
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="python -m monarch_tools",
@@ -18,25 +26,21 @@ def build_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    p_hello = subparsers.add_parser("hello")
-    p_hello.set_defaults(_handler=cmd_hello)
+    subparsers.add_parser("hello")
 
     p_name = subparsers.add_parser("name")
     p_name.add_argument("name")
-    p_name.set_defaults(_handler=cmd_name)
 
-    p_help = subparsers.add_parser("help")
-    p_help.set_defaults(_handler=cmd_help)
+    subparsers.add_parser("help")
 
     p_extract = subparsers.add_parser("extract")
     p_extract.add_argument("account_type", choices=["chase", "amex", "citi"])
     p_extract.add_argument("account_pdf")
-    p_extract.set_defaults(_handler=cmd_extract)
 
     return parser
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    handler: CommandFn = getattr(args, "_handler")
+    handler = resolve_handler(args.command)
     return int(handler(args))